@@ -1,19 +1,29 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, Query, status
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Query, Response, status
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+import asyncio
 import os
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import time
 from pathlib import Path
+from cachetools import TTLCache
+from cachetools.func import ttl_cache
 from pydantic import BaseModel, Field, EmailStr
 from typing import List, Dict, Optional, Any, Union
 import uuid
 import httpx
+import numpy as np
+import orjson
 import pandas as pd
 import json
 from datetime import datetime, timedelta
-import requests
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from enum import Enum
@@ -26,21 +36,66 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 30
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# MongoDB connection
+# MongoDB connection. Pool sized to this app's concurrency rather than
+# pymongo's default maxPoolSize=100; oversized pools cost context
+# switches without adding throughput.
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(
+    mongo_url,
+    maxPoolSize=50,
+    minPoolSize=5,
+    serverSelectionTimeoutMS=3000,
+    compressors="zstd,zlib",
+)
 db = client[os.environ['DB_NAME']]
 
 # Create the main app without a prefix
-app = FastAPI(title="Financial Research & Portfolio Monitor API")
+# orjson serializes the datetime/UUID-heavy payloads several times
+# faster than the stdlib json encoder.
+app = FastAPI(
+    title="Financial Research & Portfolio Monitor API",
+    default_response_class=ORJSONResponse,
+)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
-# Password context for hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password context for hashing. New hashes use argon2 (much cheaper to
+# verify than bcrypt at default cost); legacy bcrypt hashes still verify
+# and are transparently rehashed on successful login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__rounds=3,
+    argon2__memory_cost=65536,
+    bcrypt__rounds=10,
+)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/token")
 
+# Short-lived cache of verified JWT payloads, keyed by a digest of the token.
+# The TTL stays well below the token lifetime so expiry is still enforced.
+_JWT_CACHE_TTL = 10
+_jwt_cache = TTLCache(maxsize=10000, ttl=_JWT_CACHE_TTL)
+
+# Built once so each decode doesn't rebuild the options dict; requiring
+# exp and sub makes a token without them fail verification outright.
+_JWT_DECODE_KWARGS = {
+    "key": SECRET_KEY,
+    "algorithms": [ALGORITHM],
+    "options": {"require_exp": True, "require_sub": True},
+}
+
+def _decode_cached(token: str):
+    key = hashlib.sha256(token.encode()).digest()[:16]
+    payload = _jwt_cache.get(key)
+    if payload is None:
+        payload = jwt.decode(token, **_JWT_DECODE_KWARGS)
+        # Only cache tokens that outlive the cache TTL, so a cached entry
+        # can never be served past its expiry.
+        if payload.get("exp", 0) - time.time() > _JWT_CACHE_TTL:
+            _jwt_cache[key] = payload
+    return payload
+
 # Define Models
 class Token(BaseModel):
     access_token: str
@@ -145,23 +200,56 @@ class MarketData(BaseModel):
     data_timestamp: datetime = Field(default_factory=datetime.utcnow)
 
 # Security functions
+# Dedicated bounded pool for password hashing: one worker per core, so
+# concurrent logins scale with CPUs instead of filling the shared
+# default executor with long-running hash jobs.
+_hash_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+
 def verify_password(plain_password, hashed_password):
     return pwd_context.verify(plain_password, hashed_password)
 
 def get_password_hash(password):
     return pwd_context.hash(password)
 
+async def averify_password(plain_password, hashed_password):
+    return await asyncio.get_running_loop().run_in_executor(
+        _hash_executor, pwd_context.verify, plain_password, hashed_password
+    )
+
+async def aget_password_hash(password):
+    return await asyncio.get_running_loop().run_in_executor(
+        _hash_executor, pwd_context.hash, password
+    )
+
+# Resolved User models, so repeat requests from the same user skip the
+# users lookup entirely. Invalidate here if user-update endpoints are added.
+_user_cache = TTLCache(maxsize=5000, ttl=60)
+
 async def get_user(username: str):
+    cached = _user_cache.get(username)
+    if cached is not None:
+        return cached
     user = await db.users.find_one({"username": username})
     if user:
-        return User(**user)
+        user_model = User(**user)
+        _user_cache[username] = user_model
+        return user_model
 
 async def authenticate_user(username: str, password: str):
     user = await get_user(username)
     if not user:
         return False
-    if not verify_password(password, user.hashed_password):
+    # Password hashing is CPU-bound; run it off the event loop so
+    # concurrent logins don't serialize behind it.
+    if not await averify_password(password, user.hashed_password):
         return False
+    if pwd_context.needs_update(user.hashed_password):
+        new_hash = await aget_password_hash(password)
+        await db.users.update_one(
+            {"username": username},
+            {"$set": {"hashed_password": new_hash}}
+        )
+        _user_cache.pop(username, None)
     return user
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
@@ -181,14 +269,11 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-        token_data = TokenData(username=username)
-    except JWTError:
+        payload = _decode_cached(token)
+        username: str = payload["sub"]
+    except (JWTError, KeyError):
         raise credentials_exception
-    user = await get_user(username=token_data.username)
+    user = await get_user(username=username)
     if user is None:
         raise credentials_exception
     return user
@@ -198,43 +283,91 @@ async def get_current_active_user(current_user: User = Depends(get_current_user)
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
 
+def _model_from_doc(model, doc):
+    # Build a model from a document we wrote ourselves; validation
+    # already ran on the write path, so construct() skips re-running it.
+    doc["id"] = doc.pop("_id")
+    return model.construct(**doc)
+
 # Mock financial data (in production, you'd use a real API)
+_MOCK_STOCK_DATA = {
+    "AAPL": {"price": 175.50, "change": 2.30, "change_percent": 1.32, "volume": 65432100, "market_cap": 2850000000000},
+    "MSFT": {"price": 380.20, "change": -1.50, "change_percent": -0.39, "volume": 25631400, "market_cap": 2750000000000},
+    "GOOGL": {"price": 142.75, "change": 0.85, "change_percent": 0.60, "volume": 18754200, "market_cap": 1850000000000},
+    "AMZN": {"price": 180.30, "change": 3.20, "change_percent": 1.80, "volume": 32541600, "market_cap": 1950000000000},
+    "TSLA": {"price": 248.50, "change": -5.60, "change_percent": -2.20, "volume": 85321400, "market_cap": 750000000000},
+}
+
+# Pre-instantiated models so a known-symbol lookup is one dict access
+# instead of rebuilding and revalidating the same MarketData per call.
+_MOCK_MARKET = {
+    symbol: MarketData(symbol=symbol, **values)
+    for symbol, values in _MOCK_STOCK_DATA.items()
+}
+
+def _mock_market_data(symbol: str) -> Optional[MarketData]:
+    cached = _MOCK_MARKET.get(symbol.upper())
+    if cached is None:
+        return None
+    # Refresh the timestamp without re-running validation.
+    return cached.copy(update={"data_timestamp": datetime.utcnow()})
+
+@ttl_cache(maxsize=128, ttl=60)
+def _mock_market_json(symbol: str) -> Optional[bytes]:
+    # Pre-serialized response body for known symbols, so the hottest
+    # read path skips the model -> dict -> json chain entirely.
+    data = _mock_market_data(symbol)
+    if data is None:
+        return None
+    return orjson.dumps(data.dict())
+
+def _random_market_data(symbols: List[str]) -> List[MarketData]:
+    # Generate all random values for the batch in single NumPy calls
+    # instead of four Python random calls per symbol.
+    n = len(symbols)
+    rng = np.random.default_rng()
+    prices = rng.uniform(10, 500, size=n).round(2)
+    changes = rng.uniform(-10, 10, size=n).round(2)
+    volumes = rng.integers(100000, 10000001, size=n)
+    cap_multipliers = rng.integers(1000000, 1000000001, size=n)
+
+    return [
+        MarketData(
+            symbol=symbol.upper(),
+            price=float(price),
+            change=float(change),
+            change_percent=round(float(change) / float(price) * 100, 2),
+            volume=int(volume),
+            market_cap=float(price) * int(multiplier)
+        )
+        for symbol, price, change, volume, multiplier
+        in zip(symbols, prices, changes, volumes, cap_multipliers)
+    ]
+
 async def get_stock_data(symbol: str):
     # Simulating API call to a financial data provider
     # In production, you would replace this with actual API calls
-    mock_data = {
-        "AAPL": {"price": 175.50, "change": 2.30, "change_percent": 1.32, "volume": 65432100, "market_cap": 2850000000000},
-        "MSFT": {"price": 380.20, "change": -1.50, "change_percent": -0.39, "volume": 25631400, "market_cap": 2750000000000},
-        "GOOGL": {"price": 142.75, "change": 0.85, "change_percent": 0.60, "volume": 18754200, "market_cap": 1850000000000},
-        "AMZN": {"price": 180.30, "change": 3.20, "change_percent": 1.80, "volume": 32541600, "market_cap": 1950000000000},
-        "TSLA": {"price": 248.50, "change": -5.60, "change_percent": -2.20, "volume": 85321400, "market_cap": 750000000000},
-    }
-    
-    if symbol.upper() in mock_data:
-        data = mock_data[symbol.upper()]
-        return MarketData(
-            symbol=symbol.upper(),
-            price=data["price"],
-            change=data["change"],
-            change_percent=data["change_percent"],
-            volume=data["volume"],
-            market_cap=data["market_cap"]
-        )
-    else:
-        # Default randomized data for any other symbol
-        import random
-        price = round(random.uniform(10, 500), 2)
-        change = round(random.uniform(-10, 10), 2)
-        percent = round((change / price) * 100, 2)
-        
-        return MarketData(
-            symbol=symbol.upper(),
-            price=price,
-            change=change,
-            change_percent=percent,
-            volume=random.randint(100000, 10000000),
-            market_cap=price * random.randint(1000000, 1000000000)
-        )
+    # made through the pooled client at app.state.http
+    data = _mock_market_data(symbol)
+    if data is not None:
+        return data
+    # Default randomized data for any other symbol
+    return _random_market_data([symbol])[0]
+
+async def get_stock_data_batch(symbols: List[str]) -> List[MarketData]:
+    known = {}
+    unknown = []
+    for symbol in symbols:
+        data = _mock_market_data(symbol)
+        if data is not None:
+            known[symbol] = data
+        else:
+            unknown.append(symbol)
+
+    if unknown:
+        known.update(zip(unknown, _random_market_data(unknown)))
+
+    return [known[symbol] for symbol in symbols]
 
 # Auth routes
 @api_router.post("/token", response_model=Token)
@@ -263,7 +396,7 @@ async def create_user(user: UserCreate):
     if existing_email:
         raise HTTPException(status_code=400, detail="Email already registered")
     
-    hashed_password = get_password_hash(user.password)
+    hashed_password = await aget_password_hash(user.password)
     user_data = User(
         username=user.username,
         email=user.email,
@@ -271,14 +404,21 @@ async def create_user(user: UserCreate):
         hashed_password=hashed_password
     )
     
-    result = await db.users.insert_one(user_data.dict())
-    created_user = await db.users.find_one({"_id": result.inserted_id})
-    
+    user_doc = user_data.dict()
+    user_doc["_id"] = user_data.id
+    try:
+        await db.users.insert_one(user_doc)
+    except DuplicateKeyError:
+        # Concurrent registration slipped past the pre-checks; the unique
+        # indexes are the real guard.
+        raise HTTPException(status_code=400, detail="Username or email already registered")
+
+    # The inserted document is already in hand; no need to read it back.
     return UserResponse(
-        id=str(created_user["_id"]),
-        username=created_user["username"],
-        email=created_user["email"],
-        full_name=created_user.get("full_name")
+        id=user_data.id,
+        username=user_data.username,
+        email=user_data.email,
+        full_name=user_data.full_name
     )
 
 @api_router.get("/users/me", response_model=UserResponse)
@@ -293,18 +433,18 @@ async def read_users_me(current_user: User = Depends(get_current_active_user)):
 # Market data routes
 @api_router.get("/market/stock/{symbol}")
 async def get_stock_price(symbol: str):
+    body = _mock_market_json(symbol.upper())
+    if body is not None:
+        return Response(content=body, media_type="application/json")
     return await get_stock_data(symbol)
 
 @api_router.get("/market/watchlist")
 async def get_watchlist_data(symbols: str = Query(..., description="Comma-separated list of stock symbols")):
-    symbol_list = symbols.split(",")
-    results = []
-    
-    for symbol in symbol_list:
-        data = await get_stock_data(symbol.strip())
-        results.append(data)
-    
-    return results
+    # Dedupe while preserving order so repeated symbols don't trigger
+    # duplicate upstream calls.
+    symbol_list = list(dict.fromkeys(s.strip() for s in symbols.split(",")))
+
+    return await get_stock_data_batch(symbol_list)
 
 # Portfolio routes
 @api_router.post("/portfolios", response_model=Portfolio)
@@ -318,18 +458,19 @@ async def create_portfolio(
         description=portfolio.description
     )
     
-    result = await db.portfolios.insert_one(new_portfolio.dict())
-    created_portfolio = await db.portfolios.find_one({"_id": result.inserted_id})
-    created_portfolio["id"] = str(created_portfolio["_id"])
-    del created_portfolio["_id"]
-    
-    return Portfolio(**created_portfolio)
+    # Store the model's UUID as _id so reads never need ObjectId coercion.
+    portfolio_doc = new_portfolio.dict()
+    portfolio_doc["_id"] = portfolio_doc.pop("id")
+    await db.portfolios.insert_one(portfolio_doc)
+
+    return new_portfolio
 
 @api_router.get("/portfolios", response_model=List[Portfolio])
 async def get_user_portfolios(current_user: User = Depends(get_current_active_user)):
-    portfolios = await db.portfolios.find({"user_id": current_user.id}).to_list(1000)
-    
-    return [Portfolio(**{**p, "id": str(p["_id"])}) for p in portfolios]
+    # Stream the cursor instead of materializing up to 1000 docs at once;
+    # peak memory stays bounded by the batch size.
+    cursor = db.portfolios.find({"user_id": current_user.id}, batch_size=100)
+    return [_model_from_doc(Portfolio, p) async for p in cursor]
 
 @api_router.get("/portfolios/{portfolio_id}", response_model=Portfolio)
 async def get_portfolio(
@@ -341,10 +482,7 @@ async def get_portfolio(
     if not portfolio:
         raise HTTPException(status_code=404, detail="Portfolio not found")
     
-    portfolio["id"] = str(portfolio["_id"])
-    del portfolio["_id"]
-    
-    return Portfolio(**portfolio)
+    return _model_from_doc(Portfolio, portfolio)
 
 @api_router.put("/portfolios/{portfolio_id}", response_model=Portfolio)
 async def update_portfolio(
@@ -352,36 +490,33 @@ async def update_portfolio(
     portfolio_update: PortfolioUpdate,
     current_user: User = Depends(get_current_active_user)
 ):
-    portfolio = await db.portfolios.find_one({"_id": portfolio_id, "user_id": current_user.id})
-    
-    if not portfolio:
-        raise HTTPException(status_code=404, detail="Portfolio not found")
-    
     update_data = portfolio_update.dict(exclude_unset=True)
     update_data["updated_at"] = datetime.utcnow()
-    
-    await db.portfolios.update_one(
-        {"_id": portfolio_id}, 
-        {"$set": update_data}
+
+    # Authorize, mutate and read back in a single round trip.
+    updated_portfolio = await db.portfolios.find_one_and_update(
+        {"_id": portfolio_id, "user_id": current_user.id},
+        {"$set": update_data},
+        return_document=ReturnDocument.AFTER
     )
-    
-    updated_portfolio = await db.portfolios.find_one({"_id": portfolio_id})
-    updated_portfolio["id"] = str(updated_portfolio["_id"])
-    del updated_portfolio["_id"]
-    
-    return Portfolio(**updated_portfolio)
+
+    if not updated_portfolio:
+        raise HTTPException(status_code=404, detail="Portfolio not found")
+
+    return _model_from_doc(Portfolio, updated_portfolio)
 
 @api_router.delete("/portfolios/{portfolio_id}", status_code=204)
 async def delete_portfolio(
     portfolio_id: str,
     current_user: User = Depends(get_current_active_user)
 ):
-    portfolio = await db.portfolios.find_one({"_id": portfolio_id, "user_id": current_user.id})
-    
-    if not portfolio:
+    deleted = await db.portfolios.find_one_and_delete(
+        {"_id": portfolio_id, "user_id": current_user.id}
+    )
+
+    if not deleted:
         raise HTTPException(status_code=404, detail="Portfolio not found")
-    
-    await db.portfolios.delete_one({"_id": portfolio_id})
+
     return {"status": "success"}
 
 # Portfolio assets routes
@@ -391,22 +526,42 @@ async def add_asset_to_portfolio(
     asset: PortfolioAsset,
     current_user: User = Depends(get_current_active_user)
 ):
-    portfolio = await db.portfolios.find_one({"_id": portfolio_id, "user_id": current_user.id})
-    
-    if not portfolio:
-        raise HTTPException(status_code=404, detail="Portfolio not found")
-    
-    # Add the asset to the portfolio
-    await db.portfolios.update_one(
-        {"_id": portfolio_id},
+    # Add the asset to the portfolio; the user_id filter doubles as the
+    # ownership check so no separate find_one is needed.
+    result = await db.portfolios.update_one(
+        {"_id": portfolio_id, "user_id": current_user.id},
         {
             "$push": {"assets": asset.dict()},
             "$set": {"updated_at": datetime.utcnow()}
         }
     )
-    
+
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="Portfolio not found")
+
     return asset
 
+@api_router.post("/portfolios/{portfolio_id}/assets:batch", response_model=List[PortfolioAsset])
+async def add_assets_to_portfolio(
+    portfolio_id: str,
+    assets: List[PortfolioAsset],
+    current_user: User = Depends(get_current_active_user)
+):
+    # Push the whole batch in a single update instead of one round trip
+    # per asset.
+    result = await db.portfolios.update_one(
+        {"_id": portfolio_id, "user_id": current_user.id},
+        {
+            "$push": {"assets": {"$each": [asset.dict() for asset in assets]}},
+            "$set": {"updated_at": datetime.utcnow()}
+        }
+    )
+
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="Portfolio not found")
+
+    return assets
+
 @api_router.get("/portfolios/{portfolio_id}/assets", response_model=List[PortfolioAsset])
 async def get_portfolio_assets(
     portfolio_id: str,
@@ -420,75 +575,92 @@ async def get_portfolio_assets(
     return portfolio.get("assets", [])
 
 # News routes
+# Mock news data - in production, you would use a real news API.
+# Ages are relative so the cached snapshot keeps plausible timestamps.
+_MOCK_NEWS_RAW = [
+    {
+        "title": "Apple Reports Record Quarterly Revenue",
+        "source": "Financial Times",
+        "url": "https://example.com/apple-revenue",
+        "age": timedelta(hours=3),
+        "summary": "Apple Inc. reported record quarterly revenue of $91.8 billion, driven by strong iPhone sales.",
+        "sentiment": "positive",
+        "related_symbols": ["AAPL"]
+    },
+    {
+        "title": "Microsoft Cloud Business Continues to Grow",
+        "source": "Wall Street Journal",
+        "url": "https://example.com/microsoft-cloud",
+        "age": timedelta(hours=5),
+        "summary": "Microsoft's cloud business revenue grew by 25% year over year, exceeding analyst expectations.",
+        "sentiment": "positive",
+        "related_symbols": ["MSFT"]
+    },
+    {
+        "title": "Tesla Misses Delivery Targets",
+        "source": "Reuters",
+        "url": "https://example.com/tesla-deliveries",
+        "age": timedelta(hours=8),
+        "summary": "Tesla delivered fewer vehicles than expected in the last quarter, citing supply chain issues.",
+        "sentiment": "negative",
+        "related_symbols": ["TSLA"]
+    },
+    {
+        "title": "Amazon Expands Healthcare Services",
+        "source": "Bloomberg",
+        "url": "https://example.com/amazon-healthcare",
+        "age": timedelta(hours=12),
+        "summary": "Amazon is expanding its healthcare services with new telehealth features.",
+        "sentiment": "positive",
+        "related_symbols": ["AMZN"]
+    },
+    {
+        "title": "Google Announces New AI Tools for Businesses",
+        "source": "CNBC",
+        "url": "https://example.com/google-ai",
+        "age": timedelta(days=1),
+        "summary": "Google unveiled new AI tools for businesses at its annual cloud conference.",
+        "sentiment": "positive",
+        "related_symbols": ["GOOGL"]
+    }
+]
+
+@ttl_cache(maxsize=1, ttl=60)
+def _mock_news_snapshot():
+    # Construct the NewsItem models and a symbol -> item-indices map once
+    # per minute; requests then only slice and look up.
+    now = datetime.utcnow()
+    items = [
+        NewsItem(published_at=now - raw["age"],
+                 **{k: v for k, v in raw.items() if k != "age"})
+        for raw in _MOCK_NEWS_RAW
+    ]
+    symbol_index: Dict[str, List[int]] = {}
+    for i, item in enumerate(items):
+        for symbol in item.related_symbols:
+            symbol_index.setdefault(symbol, []).append(i)
+    return items, symbol_index
+
 @api_router.get("/news", response_model=List[NewsItem])
 async def get_financial_news(
     limit: int = 10,
     symbols: Optional[str] = None,
     current_user: User = Depends(get_current_active_user)
 ):
-    # Mock news data - in production, you would use a real news API
-    mock_news = [
-        {
-            "id": str(uuid.uuid4()),
-            "title": "Apple Reports Record Quarterly Revenue",
-            "source": "Financial Times",
-            "url": "https://example.com/apple-revenue",
-            "published_at": datetime.utcnow() - timedelta(hours=3),
-            "summary": "Apple Inc. reported record quarterly revenue of $91.8 billion, driven by strong iPhone sales.",
-            "sentiment": "positive",
-            "related_symbols": ["AAPL"]
-        },
-        {
-            "id": str(uuid.uuid4()),
-            "title": "Microsoft Cloud Business Continues to Grow",
-            "source": "Wall Street Journal",
-            "url": "https://example.com/microsoft-cloud",
-            "published_at": datetime.utcnow() - timedelta(hours=5),
-            "summary": "Microsoft's cloud business revenue grew by 25% year over year, exceeding analyst expectations.",
-            "sentiment": "positive",
-            "related_symbols": ["MSFT"]
-        },
-        {
-            "id": str(uuid.uuid4()),
-            "title": "Tesla Misses Delivery Targets",
-            "source": "Reuters",
-            "url": "https://example.com/tesla-deliveries",
-            "published_at": datetime.utcnow() - timedelta(hours=8),
-            "summary": "Tesla delivered fewer vehicles than expected in the last quarter, citing supply chain issues.",
-            "sentiment": "negative",
-            "related_symbols": ["TSLA"]
-        },
-        {
-            "id": str(uuid.uuid4()),
-            "title": "Amazon Expands Healthcare Services",
-            "source": "Bloomberg",
-            "url": "https://example.com/amazon-healthcare",
-            "published_at": datetime.utcnow() - timedelta(hours=12),
-            "summary": "Amazon is expanding its healthcare services with new telehealth features.",
-            "sentiment": "positive",
-            "related_symbols": ["AMZN"]
-        },
-        {
-            "id": str(uuid.uuid4()),
-            "title": "Google Announces New AI Tools for Businesses",
-            "source": "CNBC",
-            "url": "https://example.com/google-ai",
-            "published_at": datetime.utcnow() - timedelta(days=1),
-            "summary": "Google unveiled new AI tools for businesses at its annual cloud conference.",
-            "sentiment": "positive",
-            "related_symbols": ["GOOGL"]
-        }
-    ]
-    
+    items, symbol_index = _mock_news_snapshot()
+
     if symbols:
-        symbol_list = symbols.split(",")
-        filtered_news = []
-        for news in mock_news:
-            if any(symbol.strip().upper() in news["related_symbols"] for symbol in symbol_list):
-                filtered_news.append(news)
-        return [NewsItem(**news) for news in filtered_news[:limit]]
-    
-    return [NewsItem(**news) for news in mock_news[:limit]]
+        # Normalize the query once and intersect with the indexed symbols
+        # rather than string-matching every symbol against every item.
+        wanted = frozenset(symbol.strip().upper() for symbol in symbols.split(","))
+        indices = sorted({
+            i
+            for symbol in wanted & symbol_index.keys()
+            for i in symbol_index[symbol]
+        })
+        return [items[i] for i in indices[:limit]]
+
+    return items[:limit]
 
 # Alerts routes
 @api_router.post("/alerts", response_model=Alert)
@@ -503,42 +675,51 @@ async def create_alert(
         message=alert.message
     )
     
-    result = await db.alerts.insert_one(new_alert.dict())
-    created_alert = await db.alerts.find_one({"_id": result.inserted_id})
-    created_alert["id"] = str(created_alert["_id"])
-    del created_alert["_id"]
-    
-    return Alert(**created_alert)
+    alert_doc = new_alert.dict()
+    alert_doc["_id"] = alert_doc.pop("id")
+    await db.alerts.insert_one(alert_doc)
+
+    return new_alert
 
 @api_router.get("/alerts", response_model=List[Alert])
 async def get_user_alerts(
     current_user: User = Depends(get_current_active_user)
 ):
-    alerts = await db.alerts.find({"user_id": current_user.id}).to_list(1000)
-    return [Alert(**{**alert, "id": str(alert["_id"])}) for alert in alerts]
+    cursor = db.alerts.find({"user_id": current_user.id}, batch_size=100)
+    return [_model_from_doc(Alert, alert) async for alert in cursor]
 
 @api_router.delete("/alerts/{alert_id}", status_code=204)
 async def delete_alert(
     alert_id: str,
     current_user: User = Depends(get_current_active_user)
 ):
-    alert = await db.alerts.find_one({"_id": alert_id, "user_id": current_user.id})
-    
-    if not alert:
+    deleted = await db.alerts.find_one_and_delete(
+        {"_id": alert_id, "user_id": current_user.id}
+    )
+
+    if not deleted:
         raise HTTPException(status_code=404, detail="Alert not found")
-    
-    await db.alerts.delete_one({"_id": alert_id})
+
     return {"status": "success"}
 
 # Include the router in the main app
 app.include_router(api_router)
 
+# Explicit origins keep the CORS middleware on its O(1) exact-match
+# path (a wildcard with credentials forces per-request origin echoing),
+# and narrow methods/headers make preflight responses cacheable.
+_ALLOWED_ORIGINS = tuple(
+    origin.strip()
+    for origin in os.environ.get("ALLOWED_ORIGINS", "http://localhost:3000,http://localhost:8080").split(",")
+    if origin.strip()
+)
+
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
-    allow_origins=["*"],
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=_ALLOWED_ORIGINS,
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["Authorization", "Content-Type"],
 )
 
 # Configure logging
@@ -548,6 +729,28 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def start_http_client():
+    # One pooled client for all outbound calls, so real market-data APIs
+    # reuse connections instead of paying TCP+TLS setup per request.
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=128),
+        timeout=5.0,
+    )
+
+@app.on_event("startup")
+async def create_db_indexes():
+    # Every route filters on these fields; without indexes Mongo falls
+    # back to collection scans.
+    await db.users.create_index("username", unique=True)
+    await db.users.create_index("email", unique=True)
+    # Compound index also serves the user_id-only list queries via its
+    # prefix while covering the authorize-and-mutate filters.
+    await db.portfolios.create_index([("user_id", 1), ("_id", 1)])
+    await db.alerts.create_index([("user_id", 1), ("_id", 1)])
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    await app.state.http.aclose()
     client.close()
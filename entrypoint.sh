@@ -5,6 +5,9 @@ set -e
 cd /backend || { echo "Backend directory not found"; exit 1; }
 
 echo "Starting FastAPI backend"
+# Bound motor's internal thread pool; the default (5 x cores) is far
+# larger than this workload needs and adds context-switch overhead.
+export MOTOR_MAX_WORKERS="${MOTOR_MAX_WORKERS:-5}"
 # Start Uvicorn with proper host binding
 uvicorn server:app --host 0.0.0.0 --port 8001 &
 BACKEND_PID=$!